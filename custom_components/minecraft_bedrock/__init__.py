@@ -2,9 +2,11 @@
 
 import asyncio
 from datetime import datetime, timedelta
+import ipaddress
 import logging
+import sys
+import time
 from typing import Any, Dict
-from mcstatus.server import BedrockServer as MCStatusBedrock
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
@@ -18,13 +20,27 @@ from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType, HomeAssistantType
 
 from . import helpers
-from .const import DOMAIN, MANUFACTURER, SCAN_INTERVAL, SIGNAL_NAME_PREFIX
+from .const import (
+    DOMAIN,
+    KEY_TTL,
+    MANUFACTURER,
+    MAX_PARALLEL_STATUS_REQUESTS,
+    SCAN_INTERVAL,
+    SIGNAL_NAME_PREFIX,
+    SRV_RECORD_MIN_TTL,
+    SRV_RECORD_NEGATIVE_TTL,
+    SRV_RECORD_RETRY_TTL,
+)
 
 
-PLATFORMS = ["binary_sensor", "sensor"]
+PLATFORMS = ("binary_sensor", "sensor")
 
 _LOGGER = logging.getLogger(__name__)
 
+# Limits the number of concurrent pings (and their retry timers) across all
+# servers.
+_POLL_GATE = asyncio.Semaphore(MAX_PARALLEL_STATUS_REQUESTS)
+
 
 async def async_setup(hass: HomeAssistantType, config: ConfigType) -> bool:
     """Set up the Minecraft Server component."""
@@ -44,14 +60,11 @@ async def async_setup_entry(hass: HomeAssistantType, config_entry: ConfigEntry)
     )
     server = MinecraftServer(hass, unique_id, config_entry.data)
     domain_data[unique_id] = server
+    # Periodic update is started once the first entity listens to the server.
     await server.async_update()
-    server.start_periodic_update()
 
     # Set up platforms.
-    for platform in PLATFORMS:
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_setup(config_entry, platform)
-        )
+    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     return True
 
@@ -64,18 +77,17 @@ async def async_unload_entry(
     server = hass.data[DOMAIN][unique_id]
 
     # Unload platforms.
-    await asyncio.gather(
-        *[
-            hass.config_entries.async_forward_entry_unload(config_entry, platform)
-            for platform in PLATFORMS
-        ]
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        config_entry, PLATFORMS
     )
 
     # Clean up.
-    server.stop_periodic_update()
-    hass.data[DOMAIN].pop(unique_id)
+    if unload_ok:
+        server.stop_periodic_update()
+        server.close()
+        hass.data[DOMAIN].pop(unique_id)
 
-    return True
+    return unload_ok
 
 
 class MinecraftServer:
@@ -83,6 +95,8 @@ class MinecraftServer:
 
     # Private constants
     _MAX_RETRIES_STATUS = 3
+    _OFFLINE_THRESHOLD = 3
+    _MAX_SKIPPED_DISPATCHES = 5
 
     def __init__(
         self, hass: HomeAssistantType, unique_id: str, config_data: ConfigType
@@ -96,11 +110,20 @@ class MinecraftServer:
         self.host = config_data[CONF_HOST]
         self.port = config_data[CONF_PORT]
         self.online = False
-        self._last_status_request_failed = False
-        self.srv_record_checked = False
+        self._config_host = self.host
+        self._config_port = self.port
+        self._srv_expires_at = 0
+        try:
+            ipaddress.ip_address(self._config_host)
+        except ValueError:
+            pass
+        else:
+            # IP addresses cannot be SRV records, never resolve them.
+            self._srv_expires_at = float("inf")
+        self._consecutive_failures = 0
 
-        # 3rd party library instance
-        self._mc_status = MCStatusBedrock(self.host, self.port)
+        # Status client instance
+        self._mc_status = helpers.BedrockStatusClient(self.host, self.port)
 
         # Data provided by 3rd party library
         self.version = None
@@ -111,47 +134,68 @@ class MinecraftServer:
         self.players_list = None
         self.motd = None
         self.map = None
+        self._properties_cleared = True
+        # Device information shared by all entities of this server
+        self.device_info = {
+            "identifiers": {(DOMAIN, self.unique_id)},
+            "name": self.name,
+            "manufacturer": MANUFACTURER,
+            "model": f"Minecraft Server ({self.version})",
+            "sw_version": self.protocol_version,
+        }
         # Dispatcher signal name
-        self.signal_name = f"{SIGNAL_NAME_PREFIX}_{self.unique_id}"
+        self.signal_name = sys.intern(f"{SIGNAL_NAME_PREFIX}_{self.unique_id}")
+        # Properties sent with the last dispatcher signal
+        self._last_signature = None
+        self._skipped_dispatches = 0
 
         # Callback for stopping periodic update.
         self._stop_periodic_update = None
+        # Number of entities listening to the dispatcher signal
+        self._listener_count = 0
 
     def start_periodic_update(self) -> None:
         """Start periodic execution of update method."""
-        self._stop_periodic_update = async_track_time_interval(
-            self._hass, self.async_update, timedelta(seconds=SCAN_INTERVAL)
-        )
+        if self._stop_periodic_update is None:
+            self._stop_periodic_update = async_track_time_interval(
+                self._hass, self.async_update, timedelta(seconds=SCAN_INTERVAL)
+            )
 
     def stop_periodic_update(self) -> None:
         """Stop periodic execution of update method."""
-        self._stop_periodic_update()
+        if self._stop_periodic_update is not None:
+            self._stop_periodic_update()
+            self._stop_periodic_update = None
+
+    def add_listener(self) -> None:
+        """Register an entity and start periodic update for the first one."""
+        self._listener_count += 1
+        if self._listener_count == 1:
+            self.start_periodic_update()
+
+    def remove_listener(self) -> None:
+        """Unregister an entity and stop periodic update after the last one."""
+        self._listener_count -= 1
+        if self._listener_count == 0:
+            self.stop_periodic_update()
+
+    def close(self) -> None:
+        """Release the connection to the server."""
+        self._mc_status.close()
 
     async def async_check_connection(self) -> None:
-        """Check server connection using a 'status' request and store connection status."""
-        # Check if host is a valid SRV record, if not already done.
-        if not self.srv_record_checked:
-            self.srv_record_checked = True
-            srv_record = await helpers.async_check_srv_record(self._hass, self.host)
-            if srv_record is not None:
-                _LOGGER.debug(
-                    "'%s' is a valid Minecraft SRV record ('%s:%s')",
-                    self.host,
-                    srv_record[CONF_HOST],
-                    srv_record[CONF_PORT],
-                )
-                # Overwrite host, port and 3rd party library instance
-                # with data extracted out of SRV record.
-                self.host = srv_record[CONF_HOST]
-                self.port = srv_record[CONF_PORT]
-                self._mc_status = MCStatus(self.host, self.port)
+        """Request server status, store connection status and update properties."""
+        # Check if host is a valid SRV record, if the cached result expired.
+        if time.monotonic() >= self._srv_expires_at:
+            await self._async_resolve_srv_record()
 
-        # Ping the server with a status request.
+        # Request the server status, its response is used both as
+        # connection check and as source for the server properties.
         try:
-            await self._hass.async_add_executor_job(
-                self._mc_status.status, self._MAX_RETRIES_STATUS
-            )
-            self.online = True
+            async with _POLL_GATE:
+                status_response = await self._mc_status.async_status(
+                    self._MAX_RETRIES_STATUS
+                )
         except OSError as error:
             _LOGGER.debug(
                 "Error occurred while trying to check the connection to '%s:%s' - OSError: %s",
@@ -159,11 +203,62 @@ class MinecraftServer:
                 self.port,
                 error,
             )
-            self.online = False
+            # Only report the server as offline after several failed requests
+            # in a row, single lost UDP packets are common.
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self._OFFLINE_THRESHOLD:
+                self.online = False
+                self._clear_properties()
+        else:
+            self._consecutive_failures = 0
+            self.online = True
+            self._apply_status_response(status_response)
+
+    async def _async_resolve_srv_record(self) -> None:
+        """Resolve the configured host as SRV record and cache the result."""
+        try:
+            srv_record = await helpers.async_check_srv_record(
+                self._hass, self._config_host
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            # Lookup failed without a definitive answer, keep current host
+            # and port and retry soon.
+            _LOGGER.debug(
+                "Error occurred while trying to resolve SRV record of '%s': %s",
+                self._config_host,
+                error,
+            )
+            self._srv_expires_at = time.monotonic() + SRV_RECORD_RETRY_TTL
+            return
+
+        if srv_record is not None:
+            _LOGGER.debug(
+                "'%s' is a valid Minecraft SRV record ('%s:%s')",
+                self._config_host,
+                srv_record[CONF_HOST],
+                srv_record[CONF_PORT],
+            )
+            # Use data extracted out of SRV record until its TTL expires.
+            host = srv_record[CONF_HOST]
+            port = srv_record[CONF_PORT]
+            ttl = max(srv_record[KEY_TTL], SRV_RECORD_MIN_TTL)
+        else:
+            # No SRV record, fall back to configured data and check again later.
+            host = self._config_host
+            port = self._config_port
+            ttl = SRV_RECORD_NEGATIVE_TTL
+        self._srv_expires_at = time.monotonic() + ttl
+
+        # Overwrite host, port and status client instance if changed.
+        if (host, port) != (self.host, self.port):
+            self.host = host
+            self.port = port
+            self._mc_status.close()
+            self._mc_status = helpers.BedrockStatusClient(self.host, self.port)
 
     async def async_update(self, now: datetime = None) -> None:
         """Get server data from 3rd party library and update properties."""
-        # Check connection status.
+        # Check connection status and update properties.
         server_online_old = self.online
         await self.async_check_connection()
         server_online = self.online
@@ -174,59 +269,67 @@ class MinecraftServer:
         elif not server_online_old and server_online:
             _LOGGER.info("Connection to '%s:%s' (re-)established", self.host, self.port)
 
-        # Update the server properties if server is online.
-        if server_online:
-            await self._async_status_request()
-
-        # Notify sensors about new data.
-        async_dispatcher_send(self._hass, self.signal_name)
-
-    async def _async_status_request(self) -> None:
-        """Request server status and update properties."""
-        try:
-            status_response = await self._hass.async_add_executor_job(
-                self._mc_status.status, self._MAX_RETRIES_STATUS
+        self._notify_entities()
+
+    def _notify_entities(self) -> None:
+        """Notify sensors about new data, if any."""
+        # Latency changes alone only trigger a notification every few
+        # intervals while online.
+        signature = (
+            self.online,
+            self.version,
+            self.protocol_version,
+            self.players_online,
+            self.players_max,
+            self.motd,
+            self.map,
+        )
+        if (
+            signature != self._last_signature
+            or (
+                self.online
+                and self._skipped_dispatches >= self._MAX_SKIPPED_DISPATCHES
             )
-
-            # Got answer to request, update properties.
-
-            self.version = status_response.version.brand
-            self.players_max = status_response.players_max
-            self.players_online = status_response.players_online
-            self.latency_time = round(status_response.latency * 10000.0, 3)
-            self.motd = status_response.motd
-            self.map = status_response.map     
-            self.protocol_version = status_response.version.protocol
-            
-
-            # Inform user once about successful update if necessary.
-            if self._last_status_request_failed:
-                _LOGGER.info(
-                    "Updating the properties of '%s:%s' succeeded again",
-                    self.host,
-                    self.port,
-                )
-            self._last_status_request_failed = False
-        except OSError as error:
-            # No answer to request, set all properties to unknown.
-            self.version = None
-            self.protocol_version = None
-            self.players_online = None
-            self.players_max = None
-            self.latency_time = None
-            self.players_list = None
-            self.motd = None
-            self.map = None
-
-            # Inform user once about failed update if necessary.
-            if not self._last_status_request_failed:
-                _LOGGER.warning(
-                    "Updating the properties of '%s:%s' failed - OSError: %s",
-                    self.host,
-                    self.port,
-                    error,
-                )
-            self._last_status_request_failed = True
+        ):
+            self._last_signature = signature
+            self._skipped_dispatches = 0
+            async_dispatcher_send(self._hass, self.signal_name)
+        else:
+            self._skipped_dispatches += 1
+
+    def _apply_status_response(self, status_response) -> None:
+        """Update properties from a status response."""
+        self._properties_cleared = False
+        self.version = status_response.version.name
+        self.players_max = status_response.players_max
+        self.players_online = status_response.players_online
+        self.latency_time = int(status_response.latency * 1000) / 1000.0
+        self.motd = status_response.motd
+        self.map = status_response.map
+        self.protocol_version = status_response.version.protocol
+
+        # Update device information if necessary.
+        model = f"Minecraft Server ({self.version})"
+        if self.device_info["model"] != model:
+            self.device_info["model"] = model
+        if self.device_info["sw_version"] != self.protocol_version:
+            self.device_info["sw_version"] = self.protocol_version
+
+    def _clear_properties(self) -> None:
+        """No answer to status request, set all properties to unknown."""
+        # Nothing to do if already done by a previous failed request.
+        if self._properties_cleared:
+            return
+
+        self._properties_cleared = True
+        self.version = None
+        self.protocol_version = None
+        self.players_online = None
+        self.players_max = None
+        self.latency_time = None
+        self.players_list = None
+        self.motd = None
+        self.map = None
 
 
 class MinecraftServerEntity(Entity):
@@ -240,15 +343,8 @@ class MinecraftServerEntity(Entity):
         self._name = f"{server.name} {type_name}"
         self._icon = icon
         self._unique_id = f"{self._server.unique_id}-{type_name}"
-        self._device_info = {
-            "identifiers": {(DOMAIN, self._server.unique_id)},
-            "name": self._server.name,
-            "manufacturer": MANUFACTURER,
-            "model": f"Minecraft Server ({self._server.version})",
-            "sw_version": self._server.protocol_version,
-        }
+        self._device_info = self._server.device_info
         self._device_class = device_class
-        self._device_state_attributes = None
         self._disconnect_dispatcher = None
 
     @property
@@ -281,24 +377,22 @@ class MinecraftServerEntity(Entity):
         """Disable polling."""
         return False
 
-    async def async_update(self) -> None:
-        """Fetch data from the server."""
-        raise NotImplementedError()
-
     async def async_added_to_hass(self) -> None:
         """Connect dispatcher to signal from server."""
         self._disconnect_dispatcher = async_dispatcher_connect(
             self.hass, self._server.signal_name, self._update_callback
         )
+        self._server.add_listener()
 
     async def async_will_remove_from_hass(self) -> None:
         """Disconnect dispatcher before removal."""
         self._disconnect_dispatcher()
+        self._server.remove_listener()
 
     @callback
     def _update_callback(self) -> None:
-        """Triggers update of properties after receiving signal from server."""
-        self.async_schedule_update_ha_state(force_refresh=True)
+        """Write state after receiving signal from server."""
+        self.async_write_ha_state()
 
 async def async_migrate_entry(hass, config_entry: ConfigEntry):
     """Migrate old entry."""
@@ -21,7 +21,7 @@ async def async_setup_entry(
     entities = [MinecraftServerStatusBinarySensor(server)]
 
     # Add binary sensor entities.
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class MinecraftServerStatusBinarySensor(MinecraftServerEntity, BinarySensorEntity):
@@ -35,13 +35,8 @@ class MinecraftServerStatusBinarySensor(MinecraftServerEntity, BinarySensorEntit
             icon=ICON_STATUS,
             device_class=DEVICE_CLASS_CONNECTIVITY,
         )
-        self._is_on = False
 
     @property
     def is_on(self) -> bool:
         """Return binary state."""
-        return self._is_on
-
-    async def async_update(self) -> None:
-        """Update status."""
-        self._is_on = self._server.online
+        return self._server.online
@@ -2,6 +2,7 @@
 from functools import partial
 import ipaddress
 
+import aiodns
 import getmac
 import voluptuous as vol
 
@@ -82,6 +83,7 @@ class MinecraftServerConfigFlow(ConfigFlow, domain=DOMAIN):
                 }
                 server = MinecraftServer(self.hass, "dummy_unique_id", config_data)
                 await server.async_check_connection()
+                server.close()
                 if not server.online:
                     # Host or port invalid or server not reachable.
                     errors["base"] = "cannot_connect"
@@ -99,9 +101,12 @@ class MinecraftServerConfigFlow(ConfigFlow, domain=DOMAIN):
                             title = f"[{host}]:{port}"
                     else:
                         # Check if 'host' is a valid SRV record.
-                        srv_record = await helpers.async_check_srv_record(
-                            self.hass, host
-                        )
+                        try:
+                            srv_record = await helpers.async_check_srv_record(
+                                self.hass, host
+                            )
+                        except aiodns.error.DNSError:
+                            srv_record = None
                         if srv_record is not None:
                             # Use only SRV host name in unique_id (does not change).
                             unique_id = f"{host}-srv"
@@ -18,9 +18,12 @@ ICON_MOTD = "mdi:message-text"
 ICON_MAP= "mdi:map"
 
 KEY_SERVERS = "servers"
+KEY_TTL = "ttl"
 
 MANUFACTURER = "Mojang AB"
 
+MAX_PARALLEL_STATUS_REQUESTS = 10
+
 NAME_LATENCY_TIME = "Latency Time"
 NAME_PLAYERS_MAX = "Players Max"
 NAME_PLAYERS_ONLINE = "Players Online"
@@ -35,6 +38,9 @@ SCAN_INTERVAL = 60
 SIGNAL_NAME_PREFIX = f"signal_{DOMAIN}"
 
 SRV_RECORD_PREFIX = "_minecraft._tcp"
+SRV_RECORD_MIN_TTL = 60
+SRV_RECORD_NEGATIVE_TTL = 300
+SRV_RECORD_RETRY_TTL = 30
 
 UNIT_PLAYERS_MAX = "players"
 UNIT_PLAYERS_ONLINE = "players"
@@ -1,17 +1,27 @@
 """Helper functions for the Minecraft Server integration."""
 
+import asyncio
+import os
+import socket
+import struct
+from time import perf_counter
 from typing import Any, Dict
 
 import aiodns
+from mcstatus.bedrock_status import BedrockServerStatus
 
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.helpers.typing import HomeAssistantType
 
-from .const import SRV_RECORD_PREFIX
+from .const import KEY_TTL, SRV_RECORD_PREFIX
 
 
 async def async_check_srv_record(hass: HomeAssistantType, host: str) -> Dict[str, Any]:
-    """Check if the given host is a valid Minecraft SRV record."""
+    """Check if the given host is a valid Minecraft SRV record.
+
+    Raises 'aiodns.error.DNSError' if the lookup failed without a definitive
+    answer (e.g. timeout or server failure).
+    """
     # Check if 'host' is a valid SRV record.
     return_value = None
     srv_records = None
@@ -19,14 +29,142 @@ async def async_check_srv_record(hass: HomeAssistantType, host: str) -> Dict[str
         srv_records = await aiodns.DNSResolver().query(
             host=f"{SRV_RECORD_PREFIX}.{host}", qtype="SRV"
         )
-    except (aiodns.error.DNSError):
-        # 'host' is not a SRV record.
-        pass
+    except aiodns.error.DNSError as error:
+        # 'host' is not a SRV record, unless the lookup itself failed.
+        if error.args[0] not in (
+            aiodns.error.ARES_ENOTFOUND,
+            aiodns.error.ARES_ENODATA,
+        ):
+            raise
     else:
         # 'host' is a valid SRV record, extract the data.
         return_value = {
             CONF_HOST: srv_records[0].host,
             CONF_PORT: srv_records[0].port,
+            KEY_TTL: srv_records[0].ttl,
         }
 
     return return_value
+
+
+# RakNet unconnected ping/pong packets used for Bedrock status requests.
+_RAKNET_MAGIC = bytes.fromhex("00ffff00fefefefefdfdfdfd12345678")
+_RAKNET_UNCONNECTED_PING = b"\x01"
+_RAKNET_UNCONNECTED_PONG = b"\x1c"
+
+
+class _BedrockPingProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol resolving pending unconnected pings."""
+
+    def __init__(self) -> None:
+        """Initialize protocol without pending pings."""
+        self.transport = None
+        self._waiters = {}
+
+    def connection_made(self, transport: asyncio.DatagramTransport) -> None:
+        """Store transport."""
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        """Resolve the ping the received pong belongs to."""
+        if data[:1] != _RAKNET_UNCONNECTED_PONG:
+            return
+        # Pongs echo the ping time, which is used as ping ID. Late answers
+        # to already timed out pings are dropped.
+        waiter = self._waiters.pop(data[1:9], None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        """Fail all pending pings."""
+        self._fail_waiters(exc)
+
+    def connection_lost(self, exc: Exception) -> None:
+        """Fail all pending pings and forget transport."""
+        self.transport = None
+        self._fail_waiters(exc or ConnectionError("Connection lost"))
+
+    async def async_ping(self, ping_id: bytes, packet: bytes, timeout: float) -> bytes:
+        """Send a ping and wait for the matching pong."""
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[ping_id] = waiter
+        try:
+            self.transport.sendto(packet)
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError as error:
+            raise socket.timeout("timed out") from error
+        finally:
+            self._waiters.pop(ping_id, None)
+
+    def _fail_waiters(self, exc: Exception) -> None:
+        """Set exception on all pending pings."""
+        for waiter in self._waiters.values():
+            if not waiter.done():
+                waiter.set_exception(exc)
+        self._waiters.clear()
+
+
+class BedrockStatusClient:
+    """Bedrock server status client using a persistent asyncio UDP endpoint."""
+
+    def __init__(self, host: str, port: int, timeout: float = 3) -> None:
+        """Initialize client without opening the endpoint yet."""
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._protocol = None
+        self._client_guid = os.urandom(8)
+        self._ping_count = 0
+        self._closed = False
+
+    async def async_status(self, tries: int = 3):
+        """Request server status, retrying up to 'tries' times."""
+        for attempt in range(tries):
+            try:
+                return await self._async_read_status()
+            except OSError:
+                # Endpoint may be in a bad state, recreate it on next attempt
+                # unless the client was closed meanwhile.
+                self._close_endpoint()
+                if self._closed or attempt == tries - 1:
+                    raise
+
+    def close(self) -> None:
+        """Close the endpoint, if open, and refuse further requests."""
+        self._closed = True
+        self._close_endpoint()
+
+    def _close_endpoint(self) -> None:
+        """Close the endpoint, if open."""
+        if self._protocol is not None:
+            if self._protocol.transport is not None:
+                self._protocol.transport.close()
+            self._protocol = None
+
+    async def _async_read_status(self):
+        """Send a single unconnected ping and parse the pong."""
+        if self._closed:
+            raise ConnectionError("Client closed")
+
+        if self._protocol is None or self._protocol.transport is None:
+            transport, protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+                _BedrockPingProtocol, remote_addr=(self.host, self.port)
+            )
+            # Client may have been closed while the endpoint was created.
+            if self._closed:
+                transport.close()
+                raise ConnectionError("Client closed")
+            self._protocol = protocol
+
+        self._ping_count += 1
+        ping_id = struct.pack(">Q", self._ping_count)
+        packet = (
+            _RAKNET_UNCONNECTED_PING + ping_id + _RAKNET_MAGIC + self._client_guid
+        )
+
+        start = perf_counter()
+        data = await self._protocol.async_ping(ping_id, packet, self.timeout)
+        # Latency in milliseconds, as reported by mcstatus itself.
+        latency = (perf_counter() - start) * 1000
+
+        return BedrockServerStatus.parse_response(data, latency)
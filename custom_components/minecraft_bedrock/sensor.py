@@ -50,7 +50,7 @@ async def async_setup_entry(
         MinecraftServerMapSensor(server),
     ]
     # Add sensor entities.
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class MinecraftServerSensorEntity(MinecraftServerEntity):
@@ -66,7 +66,6 @@ class MinecraftServerSensorEntity(MinecraftServerEntity):
     ) -> None:
         """Initialize sensor base entity."""
         super().__init__(server, type_name, icon, device_class)
-        self._state = None
         self._unit = unit
 
     @property
@@ -74,11 +73,6 @@ class MinecraftServerSensorEntity(MinecraftServerEntity):
         """Return sensor availability."""
         return self._server.online
 
-    @property
-    def state(self) -> Any:
-        """Return sensor state."""
-        return self._state
-
     @property
     def unit_of_measurement(self) -> str:
         """Return sensor measurement unit."""
@@ -94,9 +88,10 @@ class MinecraftServerVersionSensor(MinecraftServerSensorEntity):
             server=server, type_name=NAME_VERSION, icon=ICON_VERSION, unit=UNIT_VERSION
         )
 
-    async def async_update(self) -> None:
-        """Update version."""
-        self._state = self._server.name
+    @property
+    def state(self) -> Any:
+        """Return version."""
+        return self._server.version
 
 
 class MinecraftServerProtocolVersionSensor(MinecraftServerSensorEntity):
@@ -111,9 +106,10 @@ class MinecraftServerProtocolVersionSensor(MinecraftServerSensorEntity):
             unit=UNIT_PROTOCOL_VERSION,
         )
 
-    async def async_update(self) -> None:
-        """Update protocol version."""
-        self._state = self._server.protocol_version
+    @property
+    def state(self) -> Any:
+        """Return protocol version."""
+        return self._server.protocol_version
 
 
 class MinecraftServerLatencyTimeSensor(MinecraftServerSensorEntity):
@@ -128,9 +124,10 @@ class MinecraftServerLatencyTimeSensor(MinecraftServerSensorEntity):
             unit=TIME_MILLISECONDS,
         )
 
-    async def async_update(self) -> None:
-        """Update latency time."""
-        self._state = self._server.latency_time
+    @property
+    def state(self) -> Any:
+        """Return latency time."""
+        return self._server.latency_time
 
 
 class MinecraftServerPlayersOnlineSensor(MinecraftServerSensorEntity):
@@ -145,23 +142,22 @@ class MinecraftServerPlayersOnlineSensor(MinecraftServerSensorEntity):
             unit=UNIT_PLAYERS_ONLINE,
         )
 
-    async def async_update(self) -> None:
-        """Update online players state and device state attributes."""
-        self._state = self._server.players.online
+    @property
+    def state(self) -> Any:
+        """Return number of online players."""
+        return self._server.players_online
 
+    @property
+    def device_state_attributes(self) -> Dict[str, Any]:
+        """Return players list in device state attributes."""
         device_state_attributes = None
         players_list = self._server.players_list
 
         if players_list is not None:
             if len(players_list) != 0:
-                device_state_attributes = {ATTR_PLAYERS_LIST: self._server.players_list}
-
-        self._device_state_attributes = device_state_attributes
+                device_state_attributes = {ATTR_PLAYERS_LIST: players_list}
 
-    @property
-    def device_state_attributes(self) -> Dict[str, Any]:
-        """Return players list in device state attributes."""
-        return self._device_state_attributes
+        return device_state_attributes
 
 
 class MinecraftServerPlayersMaxSensor(MinecraftServerSensorEntity):
@@ -176,9 +172,10 @@ class MinecraftServerPlayersMaxSensor(MinecraftServerSensorEntity):
             unit=UNIT_PLAYERS_MAX,
         )
 
-    async def async_update(self) -> None:
-        """Update maximum number of players."""
-        self._state = self._server.players.max
+    @property
+    def state(self) -> Any:
+        """Return maximum number of players."""
+        return self._server.players_max
 
 
 class MinecraftServerMOTDSensor(MinecraftServerSensorEntity):
@@ -193,9 +190,10 @@ class MinecraftServerMOTDSensor(MinecraftServerSensorEntity):
             unit=UNIT_MOTD,
         )
 
-    async def async_update(self) -> None:
-        """Update motd."""
-        self._state = self._server.motd
+    @property
+    def state(self) -> Any:
+        """Return motd."""
+        return self._server.motd
   
 class MinecraftServerMapSensor(MinecraftServerSensorEntity):
     """Representation of a Minecraft Server map sensor."""
@@ -209,7 +207,8 @@ class MinecraftServerMapSensor(MinecraftServerSensorEntity):
             unit=UNIT_MAP,
         )
 
-    async def async_update(self) -> None:
-        """Update map."""
-        self._state = self._server.map_name
+    @property
+    def state(self) -> Any:
+        """Return map."""
+        return self._server.map
         
\ No newline at end of file